@@ -119,6 +119,10 @@ class ConfigManager(BaseInterfaceModel):
 
     _cached_configs: Dict[str, Dict[str, Any]] = {}
 
+    # Bumped on every forced reload so dependent caches (such as the network
+    # manager's merged-ecosystems mapping) can key on the loaded-config state.
+    _config_revision: int = 0
+
     @model_validator(mode="before")
     @classmethod
     def check_config_for_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -273,6 +277,7 @@ class ConfigManager(BaseInterfaceModel):
 
         if force_reload:
             self._cached_configs = {}
+            self._config_revision += 1
 
         _ = self._plugin_configs
 
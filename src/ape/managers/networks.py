@@ -1,8 +1,6 @@
-import json
+import re
 from functools import cached_property
-from typing import Collection, Dict, Iterator, List, Optional, Set, Type, Union
-
-import yaml
+from typing import Collection, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from ape.api import EcosystemAPI, ProviderAPI, ProviderContextManager
 from ape.api.networks import NetworkAPI
@@ -36,6 +34,25 @@ class NetworkManager(BaseManager):
     _active_provider: Optional[ProviderAPI] = None
     _default_ecosystem_name: Optional[str] = None
 
+    # Cache for the merged ecosystems mapping; invalidated when the config
+    # manager's revision changes (see ``ecosystems``).
+    _ecosystems_cache: Optional[Dict[str, EcosystemAPI]] = None
+    _ecosystems_cache_key: Optional[int] = None
+
+    # Cached (ecosystem names, network names, provider names) triple from a single
+    # traversal of the network tree; cleared whenever the ecosystems mapping rebuilds.
+    _network_names_cache: Optional[Tuple[Set[str], Set[str], Set[str]]] = None
+
+    # Cached ``(name, ecosystem)`` snapshot of the default ecosystem.
+    _default_ecosystem_cache: Optional[Tuple[str, EcosystemAPI]] = None
+
+    # Custom-ecosystem clones keyed by ``(base ecosystem, custom name)``.
+    _custom_ecosystem_cache: Optional[Dict[Tuple[str, str], EcosystemAPI]] = None
+
+    # Resolved ``(config revision, name)`` of the default ecosystem so the hot
+    # path skips config-manager access until the config reloads.
+    _resolved_default_ecosystem_name: Optional[Tuple[int, str]] = None
+
     @log_instead_of_fail(default="<NetworkManager>")
     def __repr__(self) -> str:
         provider = self.active_provider
@@ -104,17 +121,22 @@ class NetworkManager(BaseManager):
         Returns:
             :class:`~ape.api.networks.ProviderContextManager`
         """
+        # Resolve the provider chain once instead of per property access.
+        provider = self.provider
+        network = provider.network
+        ecosystem = network.ecosystem
+
         try:
-            forked_network = self.ecosystem.get_network(f"{self.network.name}-fork")
+            forked_network = ecosystem.get_network(f"{network.name}-fork")
         except NetworkNotFoundError as err:
-            raise NetworkError(f"Unable to fork network '{self.network.name}'.") from err
+            raise NetworkError(f"Unable to fork network '{network.name}'.") from err
 
         provider_settings = provider_settings or {}
         fork_settings = {}
         if block_number is not None:
             # Negative block_number means relative to HEAD
             if block_number < 0:
-                latest_block_number = self.provider.get_block("latest").number or 0
+                latest_block_number = provider.get_block("latest").number or 0
                 block_number = latest_block_number + block_number
                 if block_number < 0:
                     # If the block number is still negative, they have forked past genesis.
@@ -123,12 +145,12 @@ class NetworkManager(BaseManager):
             # Ensure block_number is set in config for this network
             fork_settings["block_number"] = block_number
 
-        if uri := self.provider.connection_str:
+        if uri := provider.connection_str:
             fork_settings["upstream_provider"] = uri
 
         _dict_overlay(
             provider_settings,
-            {"fork": {self.ecosystem.name: {self.network.name: fork_settings}}},
+            {"fork": {ecosystem.name: {network.name: fork_settings}}},
         )
 
         shared_kwargs: dict = {"provider_settings": provider_settings, "disconnect_after": True}
@@ -144,7 +166,7 @@ class NetworkManager(BaseManager):
         The set of all ecosystem names in ``ape``.
         """
 
-        return set(self.ecosystems)
+        return set(self._collect_names()[0])
 
     @property
     def network_names(self) -> Set[str]:
@@ -152,7 +174,7 @@ class NetworkManager(BaseManager):
         The set of all network names in ``ape``.
         """
 
-        return {n for e in self.ecosystems.values() for n in e.networks}
+        return set(self._collect_names()[1])
 
     @property
     def provider_names(self) -> Set[str]:
@@ -160,22 +182,45 @@ class NetworkManager(BaseManager):
         The set of all provider names in ``ape``.
         """
 
-        return set(
-            provider
-            for ecosystem in self.ecosystems.values()
-            for network in ecosystem.networks.values()
-            for provider in network.providers
-        )
+        return set(self._collect_names()[2])
+
+    def _collect_names(self) -> Tuple[Set[str], Set[str], Set[str]]:
+        # Walk the ecosystems x networks x providers tree once, since
+        # ``EcosystemAPI.networks`` and ``NetworkAPI.providers`` are non-trivial
+        # properties and the name sets are often requested together.
+        # NOTE: Returns the cached sets themselves; the public properties hand
+        # out copies so callers cannot mutate the cache.
+        ecosystems = self.ecosystems
+        if self._network_names_cache is not None:
+            return self._network_names_cache
+
+        ecosystem_names = set(ecosystems)
+        network_names: Set[str] = set()
+        provider_names: Set[str] = set()
+        for ecosystem in ecosystems.values():
+            for network_name, network in ecosystem.networks.items():
+                network_names.add(network_name)
+                provider_names.update(network.providers)
+
+        self._network_names_cache = (ecosystem_names, network_names, provider_names)
+        return self._network_names_cache
 
     @property
     def ecosystems(self) -> Dict[str, EcosystemAPI]:
         """
         All the registered ecosystems in ``ape``, such as ``ethereum``.
         """
-        ecosystem_objs = self._plugin_ecosystems
+        # The config manager bumps its revision on forced reloads, so the merged
+        # mapping stays valid until then and repeat accesses skip the config
+        # lookup and re-merging custom networks (a `model_copy` per network).
+        cache_key = self.config_manager._config_revision
+        if self._ecosystems_cache is not None and self._ecosystems_cache_key == cache_key:
+            return self._ecosystems_cache
 
         # Load config.
         custom_networks: List = self.config_manager.get_config("networks").get("custom", [])
+
+        ecosystem_objs = self._plugin_ecosystems
         for custom_network in custom_networks:
             ecosystem_name = custom_network.ecosystem
             if ecosystem_name in ecosystem_objs:
@@ -185,26 +230,45 @@ class NetworkManager(BaseManager):
             base_ecosystem_name = (
                 custom_network.get("base_ecosystem_plugin") or self.default_ecosystem_name
             )
-            existing_cls = ecosystem_objs[base_ecosystem_name]
-            ecosystem_cls = existing_cls.model_copy(
-                update={"name": ecosystem_name}, cache_clear=("_networks_from_plugins",)
-            )
+
+            # ``model_copy`` deep-copies and re-validates the pydantic model, so
+            # reuse clones across rebuilds; the result only depends on the
+            # base-ecosystem / custom-name pair.
+            if self._custom_ecosystem_cache is None:
+                self._custom_ecosystem_cache = {}
+
+            clone_key = (base_ecosystem_name, ecosystem_name)
+            if (ecosystem_cls := self._custom_ecosystem_cache.get(clone_key)) is None:
+                existing_cls = ecosystem_objs[base_ecosystem_name]
+                ecosystem_cls = existing_cls.model_copy(
+                    update={"name": ecosystem_name}, cache_clear=("_networks_from_plugins",)
+                )
+                self._custom_ecosystem_cache[clone_key] = ecosystem_cls
+
             ecosystem_objs[ecosystem_name] = ecosystem_cls
 
+        self._ecosystems_cache = ecosystem_objs
+        self._ecosystems_cache_key = cache_key
+        self._network_names_cache = None
+        self._default_ecosystem_cache = None
+        self._resolved_default_ecosystem_name = None
         return ecosystem_objs
 
     @cached_property
     def _plugin_ecosystems(self) -> Dict[str, EcosystemAPI]:
-        def to_kwargs(name: str) -> Dict:
-            return {
-                "name": name,
-                "data_folder": self.config_manager.DATA_FOLDER / name,
-                "request_header": self.config_manager.REQUEST_HEADER,
-            }
+        # Hoist the shared kwargs out of the comprehension; only the name
+        # and derived data folder differ per plugin.
+        data_folder = self.config_manager.DATA_FOLDER
+        request_header = self.config_manager.REQUEST_HEADER
 
         # Load plugins.
         plugins = self.plugin_manager.ecosystems
-        return {n: cls(**to_kwargs(n)) for n, cls in plugins}  # type: ignore[operator]
+        return {
+            n: cls(  # type: ignore[operator]
+                name=n, data_folder=data_folder / n, request_header=request_header
+            )
+            for n, cls in plugins
+        }
 
     def create_custom_provider(
         self,
@@ -249,7 +313,7 @@ class NetworkManager(BaseManager):
             name = provider_name
 
         provider_settings: Dict = {}
-        if connection_str.startswith("https://") or connection_str.startswith("http://"):
+        if connection_str.startswith(("http://", "https://")):
             provider_settings["uri"] = connection_str
         elif connection_str.endswith(".ipc"):
             provider_settings["ipc_path"] = connection_str
@@ -287,10 +351,10 @@ class NetworkManager(BaseManager):
         Returns:
             :class:`~ape.api.networks.EcosystemAPI`
         """
-        if ecosystem_name not in self.ecosystems:
+        if (ecosystem := self.ecosystems.get(ecosystem_name)) is None:
             raise IndexError(f"Unknown ecosystem '{ecosystem_name}'.")
 
-        return self.ecosystems[ecosystem_name]
+        return ecosystem
 
     def __getattr__(self, attr_name: str) -> EcosystemAPI:
         """
@@ -307,11 +371,16 @@ class NetworkManager(BaseManager):
             eth = networks.ethereum
         """
         _assert_not_ipython_check(attr_name)
-        options = {attr_name, attr_name.replace("-", "_"), attr_name.replace("_", "-")}
         ecosystems = self.ecosystems
-        for opt in options:
-            if opt in ecosystems:
-                return ecosystems[opt]
+        if attr_name in ecosystems:
+            return ecosystems[attr_name]
+
+        # Only try the hyphen/underscore variants when they could differ;
+        # __getattr__ also fires for every missed attribute lookup.
+        if "-" in attr_name or "_" in attr_name:
+            for opt in (attr_name.replace("-", "_"), attr_name.replace("_", "-")):
+                if opt in ecosystems:
+                    return ecosystems[opt]
 
         raise ApeAttributeError(f"{NetworkManager.__name__} has no attribute '{attr_name}'.")
 
@@ -345,24 +414,41 @@ class NetworkManager(BaseManager):
             Iterator[str]: An iterator over all the network-choice possibilities.
         """
 
-        ecosystem_filter = _validate_filter(ecosystem_filter, self.ecosystem_names)
-        network_filter = _validate_filter(network_filter, self.network_names)
-        provider_filter = _validate_filter(provider_filter, self.provider_names)
+        # NOTE: This must stay a generator. The CLI wraps the call in a lazy
+        # sequence so the tree walk (and filter validation) happens after the
+        # project config has loaded, not when the option is constructed.
+        ecosystem_names, network_names, provider_names = self._collect_names()
+        ecosystem_filter = _validate_filter(ecosystem_filter, ecosystem_names)
+        network_filter = _validate_filter(network_filter, network_names)
+        provider_filter = _validate_filter(provider_filter, provider_names)
 
         ecosystem_items = self.ecosystems
-        if ecosystem_filter:
-            ecosystem_items = {n: e for n, e in ecosystem_items.items() if n in ecosystem_filter}
+
+        # Hoist the default names out of the loops; both are non-trivial
+        # properties and otherwise get re-evaluated on every yield.
+        default_ecosystem_name = self.default_ecosystem.name
 
         for ecosystem_name, ecosystem in ecosystem_items.items():
+            if ecosystem_filter and ecosystem_name not in ecosystem_filter:
+                continue
+
             network_items = ecosystem.networks
+
+            # Filter by name in the loops below rather than rebuilding the dicts.
             if network_filter:
-                network_items = {n: net for n, net in network_items.items() if n in network_filter}
+                network_names_to_use = [n for n in network_items if n in network_filter]
+            else:
+                network_names_to_use = list(network_items)
 
-            if not network_items:
+            if not network_names_to_use:
                 continue
 
+            is_default_ecosystem = ecosystem_name == default_ecosystem_name
+            default_network_name = ecosystem.default_network_name
+
             ecosystem_has_providers = False
-            for network_name, network in network_items.items():
+            for network_name in network_names_to_use:
+                network = network_items[network_name]
                 providers = network.providers
                 if provider_filter:
                     providers = [n for n in providers if n in provider_filter]
@@ -375,24 +461,22 @@ class NetworkManager(BaseManager):
                 if not network_has_providers:
                     continue
 
+                is_default_network = network_name == default_network_name
                 for provider_name in providers:
-                    if (
-                        ecosystem_name == self.default_ecosystem.name
-                        and network_name == ecosystem.default_network_name
-                    ):
+                    if is_default_ecosystem and is_default_network:
                         yield f"::{provider_name}"
 
-                    if ecosystem_name == self.default_ecosystem.name:
+                    if is_default_ecosystem:
                         yield f":{network_name}:{provider_name}"
 
-                    if network_name == ecosystem.default_network_name:
+                    if is_default_network:
                         yield f"{ecosystem_name}::{provider_name}"
 
-                    # Always include the full path as an option.
+                    # Always yield the full path as an option.
                     yield f"{ecosystem_name}:{network_name}:{provider_name}"
 
                 # Providers were yielded if we reached this point.
-                if ecosystem_name == self.default_ecosystem.name:
+                if is_default_ecosystem:
                     yield f":{network_name}"
 
                 yield f"{ecosystem_name}:{network_name}"
@@ -414,10 +498,10 @@ class NetworkManager(BaseManager):
             :class:`~ape.api.networks.EcosystemAPI`
         """
 
-        if ecosystem_name not in self.ecosystem_names:
+        if (ecosystem := self.ecosystems.get(ecosystem_name)) is None:
             raise EcosystemNotFoundError(ecosystem_name, options=self.ecosystem_names)
 
-        return self.ecosystems[ecosystem_name]
+        return ecosystem
 
     def get_provider_from_choice(
         self,
@@ -453,20 +537,16 @@ class NetworkManager(BaseManager):
             # Custom network w/o ecosystem & network spec.
             return self.create_custom_provider(network_choice)
 
-        selections = network_choice.split(":")
+        default_ecosystem = self.default_ecosystem
 
-        # NOTE: Handle case when URI is passed e.g. "http://..."
-        if len(selections) > 3:
-            provider_value = ":".join(selections[2:])
-            selections[2] = provider_value
-            selections = selections[:3]
-            if _is_custom_network(provider_value):
-                selections[1] = selections[1] or "custom"
+        # Limit the split so a URI provider value (e.g. "http://...") stays intact.
+        selections = network_choice.split(":", 2)
+        if len(selections) == 3 and _is_custom_network(selections[2]):
+            selections[1] = selections[1] or "custom"
 
-        if selections == network_choice or len(selections) == 1:
-            # Either split didn't work (in which case it matches the start)
-            # or there was nothing after the ``:`` (e.g. "ethereum:")
-            ecosystem = self.get_ecosystem(selections[0] or self.default_ecosystem.name)
+        if len(selections) == 1:
+            # No ``:`` in the choice; it is just an ecosystem name (or empty).
+            ecosystem = self.get_ecosystem(selections[0] or default_ecosystem.name)
             # By default, the "local" network should be specified for
             # any ecosystem (this should not correspond to a production chain)
             default_network = ecosystem.default_network
@@ -475,16 +555,14 @@ class NetworkManager(BaseManager):
         elif len(selections) == 2:
             # Only ecosystem and network were specified, not provider
             ecosystem_name, network_name = selections
-            ecosystem = self.get_ecosystem(ecosystem_name or self.default_ecosystem.name)
+            ecosystem = self.get_ecosystem(ecosystem_name or default_ecosystem.name)
             network = ecosystem.get_network(network_name or ecosystem.default_network_name)
             return network.get_provider(provider_settings=provider_settings)
 
         elif len(selections) == 3:
             # Everything is specified, use specified provider for ecosystem and network
             ecosystem_name, network_name, provider_name = selections
-            ecosystem = (
-                self.get_ecosystem(ecosystem_name) if ecosystem_name else self.default_ecosystem
-            )
+            ecosystem = self.get_ecosystem(ecosystem_name) if ecosystem_name else default_ecosystem
             network = ecosystem.get_network(network_name or ecosystem.default_network_name)
             return network.get_provider(
                 provider_name=provider_name, provider_settings=provider_settings
@@ -540,7 +618,16 @@ class NetworkManager(BaseManager):
         if name := self._default_ecosystem_name:
             return name
 
-        return self.config_manager.default_ecosystem or "ethereum"
+        # Key on the config revision; ``ConfigManager.load()`` reassigns
+        # ``default_ecosystem`` on every forced reload (e.g. project switches).
+        revision = self.config_manager._config_revision
+        resolved = self._resolved_default_ecosystem_name
+        if resolved is not None and resolved[0] == revision:
+            return resolved[1]
+
+        name = self.config_manager.default_ecosystem or "ethereum"
+        self._resolved_default_ecosystem_name = (revision, name)
+        return name
 
     @property
     def default_ecosystem(self) -> EcosystemAPI:
@@ -552,7 +639,13 @@ class NetworkManager(BaseManager):
         that ecosystem.
         """
 
-        return self.ecosystems[self.default_ecosystem_name]
+        name = self.default_ecosystem_name
+        if (cached := self._default_ecosystem_cache) is not None and cached[0] == name:
+            return cached[1]
+
+        ecosystem = self.ecosystems[name]
+        self._default_ecosystem_cache = (name, ecosystem)
+        return ecosystem
 
     def set_default_ecosystem(self, ecosystem_name: str):
         """
@@ -568,6 +661,13 @@ class NetworkManager(BaseManager):
 
         if ecosystem_name in self.ecosystem_names:
             self._default_ecosystem_name = ecosystem_name
+            # The default ecosystem affects how custom networks resolve their base
+            # ecosystem, so the merged mapping must be rebuilt.
+            self._ecosystems_cache = None
+            self._ecosystems_cache_key = None
+            self._network_names_cache = None
+            self._default_ecosystem_cache = None
+            self._resolved_default_ecosystem_name = None
 
         else:
             raise EcosystemNotFoundError(ecosystem_name, options=self.ecosystem_names)
@@ -591,18 +691,31 @@ class NetworkManager(BaseManager):
         network_filter: Optional[Collection[str]] = None,
         provider_filter: Optional[Collection[str]] = None,
     ):
-        data: Dict = {"ecosystems": []}
+        return {
+            "ecosystems": list(
+                self._iter_ecosystem_data(
+                    ecosystem_filter=ecosystem_filter,
+                    network_filter=network_filter,
+                    provider_filter=provider_filter,
+                )
+            )
+        }
 
+    def _iter_ecosystem_data(
+        self,
+        ecosystem_filter: Optional[Collection[str]] = None,
+        network_filter: Optional[Collection[str]] = None,
+        provider_filter: Optional[Collection[str]] = None,
+    ) -> Iterator[Dict]:
+        # Yield one ecosystem dict at a time so callers that process
+        # incrementally never hold the whole tree in memory.
         for ecosystem_name in self:
             if ecosystem_filter and ecosystem_name not in ecosystem_filter:
                 continue
 
-            ecosystem_data = self._get_ecosystem_data(
+            yield self._get_ecosystem_data(
                 ecosystem_name, network_filter=network_filter, provider_filter=provider_filter
             )
-            data["ecosystems"].append(ecosystem_data)
-
-        return data
 
     def _get_ecosystem_data(
         self,
@@ -642,6 +755,17 @@ class NetworkManager(BaseManager):
         Returns:
             str
         """
+        # Imported here so `import ape` does not pay the PyYAML import cost;
+        # this deprecated property is the only consumer in the module.
+        import json
+
+        import yaml
+
+        try:
+            # Use the libyaml-backed dumper when available; it is several times faster.
+            from yaml import CSafeDumper as _YamlDumper  # type: ignore[attr-defined]
+        except ImportError:
+            from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
 
         data = self.network_data
         if not isinstance(data, dict):
@@ -651,7 +775,7 @@ class NetworkManager(BaseManager):
             )
 
         try:
-            return yaml.dump(data, sort_keys=True)
+            return yaml.dump(data, Dumper=_YamlDumper, sort_keys=True)
         except ValueError as err:
             try:
                 data_str = json.dumps(data)
@@ -663,24 +787,22 @@ class NetworkManager(BaseManager):
             ) from err
 
 
-def _validate_filter(arg: Optional[Union[List[str], str]], options: Set[str]):
-    filters = arg or []
-
-    if isinstance(filters, str):
-        filters = [filters]
+def _validate_filter(arg: Optional[Union[List[str], str]], options: Set[str]) -> FrozenSet[str]:
+    if not arg:
+        return frozenset()
 
-    for _filter in filters:
-        if _filter not in options:
-            raise NetworkError(f"Unknown option '{_filter}'.")
+    filters = frozenset((arg,) if isinstance(arg, str) else arg)
+    if unknown := filters - options:
+        raise NetworkError(f"Unknown option '{sorted(unknown)[0]}'.")
 
     return filters
 
 
+# Compiled once so scheme detection is a single C-level scan per call.
+_CUSTOM_NETWORK_SCHEME_PATTERN = re.compile(r"^(?:https?|wss?)://")
+
+
 def _is_custom_network(value: str) -> bool:
-    return (
-        value.startswith("http://")
-        or value.startswith("https://")
-        or value.startswith("ws://")
-        or value.startswith("wss://")
-        or (value.endswith(".ipc") and ":" not in value)
+    return _CUSTOM_NETWORK_SCHEME_PATTERN.match(value) is not None or (
+        value.endswith(".ipc") and ":" not in value
     )
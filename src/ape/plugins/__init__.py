@@ -1,8 +1,6 @@
 import functools
-import importlib
-import pkgutil
-import subprocess
-from typing import Any, Callable, Generator, Iterator, List, Optional, Set, Tuple, Type
+from types import GeneratorType
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, Set, Tuple, Type
 
 from ape.__modules__ import __modules__
 from ape.exceptions import ApeAttributeError
@@ -10,48 +8,85 @@ from ape.logging import logger
 from ape.utils.basemodel import _assert_not_ipython_check
 from ape.utils.misc import log_instead_of_fail
 
-from .account import AccountPlugin
-from .compiler import CompilerPlugin
-from .config import Config
-from .converter import ConversionPlugin
-from .network import EcosystemPlugin, ExplorerPlugin, NetworkPlugin, ProviderPlugin
 from .pluggy_patch import PluginType, hookimpl
 from .pluggy_patch import plugin_manager as pluggy_manager
-from .project import DependencyPlugin, ProjectPlugin
-from .query import QueryPlugin
 
 
 class PluginError(Exception):
     pass
 
 
-# Combine all the plugins together via subclassing (merges `hookspec`s)
-class AllPluginHooks(
-    Config,
-    AccountPlugin,
-    CompilerPlugin,
-    ConversionPlugin,
-    DependencyPlugin,
-    EcosystemPlugin,
-    ExplorerPlugin,
-    NetworkPlugin,
-    ProjectPlugin,
-    ProviderPlugin,
-    QueryPlugin,
-):
-    pass
-
-
-# All hookspecs are registered
-pluggy_manager.add_hookspecs(AllPluginHooks)
-
-
+# The hookspec submodules import `ape.api`, which is expensive; defer them (and
+# building the merged hookspec class) until a plugin type is actually needed.
+_PLUGIN_TYPE_MODULES = {
+    "AccountPlugin": "account",
+    "CompilerPlugin": "compiler",
+    "Config": "config",
+    "ConversionPlugin": "converter",
+    "DependencyPlugin": "project",
+    "EcosystemPlugin": "network",
+    "ExplorerPlugin": "network",
+    "NetworkPlugin": "network",
+    "ProjectPlugin": "project",
+    "ProviderPlugin": "network",
+    "QueryPlugin": "query",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_all_plugin_hooks() -> type:
+    from .account import AccountPlugin
+    from .compiler import CompilerPlugin
+    from .config import Config
+    from .converter import ConversionPlugin
+    from .network import EcosystemPlugin, ExplorerPlugin, NetworkPlugin, ProviderPlugin
+    from .project import DependencyPlugin, ProjectPlugin
+    from .query import QueryPlugin
+
+    # Combine all the plugins together via subclassing (merges `hookspec`s)
+    class AllPluginHooks(
+        Config,
+        AccountPlugin,
+        CompilerPlugin,
+        ConversionPlugin,
+        DependencyPlugin,
+        EcosystemPlugin,
+        ExplorerPlugin,
+        NetworkPlugin,
+        ProjectPlugin,
+        ProviderPlugin,
+        QueryPlugin,
+    ):
+        pass
+
+    # All hookspecs are registered
+    pluggy_manager.add_hookspecs(AllPluginHooks)
+    return AllPluginHooks
+
+
+def __getattr__(name: str):
+    # PEP 562: expose the plugin types (and the merged hookspec class) without
+    # importing their modules at `import ape.plugins` time.
+    if name == "AllPluginHooks":
+        return _get_all_plugin_hooks()
+
+    if (module_name := _PLUGIN_TYPE_MODULES.get(name)) is not None:
+        import importlib
+
+        module = importlib.import_module(f".{module_name}", __name__)
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=256)
 def clean_plugin_name(name: str) -> str:
     return name.replace("_", "-").replace("ape-", "")
 
 
 def get_hooks(plugin_type):
-    return [name for name, method in plugin_type.__dict__.items() if hasattr(method, "ape_spec")]
+    # ``_ape_hooks`` is precomputed by ``PluginType.__init_subclass__``.
+    return sorted(plugin_type._ape_hooks)
 
 
 def register(plugin_type: Type[PluginType], **hookimpl_kwargs) -> Callable:
@@ -77,25 +112,38 @@ def register(plugin_type: Type[PluginType], **hookimpl_kwargs) -> Callable:
 
     # NOTE: we are basically checking that `plugin_type`
     #       is one of the parent classes of `Plugins`
-    if not issubclass(AllPluginHooks, plugin_type):
+    if not issubclass(_get_all_plugin_hooks(), plugin_type):
         raise PluginError("Not a valid plugin type to register.")
 
-    def check_hook(plugin_type, hookimpl_kwargs, fn):
-        fn = hookimpl(fn, **hookimpl_kwargs)
+    # Pre-bind the marker once; each decorated function then only pays for
+    # the wrapping call and an O(1) name check.
+    impl = functools.partial(hookimpl, **hookimpl_kwargs)
+    valid_hooks = plugin_type._ape_hooks
 
-        if not hasattr(plugin_type, fn.__name__):
-            hooks = get_hooks(plugin_type)
+    def check_hook(fn):
+        fn = impl(fn)
 
+        if fn.__name__ not in valid_hooks and not hasattr(plugin_type, fn.__name__):
             raise PluginError(
                 f"Registered function `{fn.__name__}` is not"
                 f" a valid hook for {plugin_type.__name__}, must be one of:"
-                f" {hooks}."
+                f" {get_hooks(plugin_type)}."
             )
 
         return fn
 
-    # NOTE: Get around issue with using `plugin_type` raw in `check_hook`
-    return functools.partial(check_hook, plugin_type, hookimpl_kwargs)
+    return check_hook
+
+
+# NOTE: Bounded because some hooks construct a fresh class per call (e.g.
+# ``create_network_type``); an unbounded cache would pin those forever.
+@functools.lru_cache(maxsize=256)
+def _valid_class_impl(api_class: type) -> bool:
+    # Is not an ABC base class or abstractdataclass
+    if not hasattr(api_class, "__abstractmethods__"):
+        return True  # not an abstract class
+
+    return len(api_class.__abstractmethods__) == 0
 
 
 def valid_impl(api_class: Any) -> bool:
@@ -113,6 +161,10 @@ def valid_impl(api_class: Any) -> bool:
     if isinstance(api_class, tuple):
         return all(valid_impl(c) for c in api_class)
 
+    elif isinstance(api_class, type):
+        # Cached; a class's abstract-method set is fixed after construction.
+        return _valid_class_impl(api_class)
+
     # Is not an ABC base class or abstractdataclass
     if not hasattr(api_class, "__abstractmethods__"):
         return True  # not an abstract class
@@ -120,12 +172,54 @@ def valid_impl(api_class: Any) -> bool:
     return len(api_class.__abstractmethods__) == 0
 
 
+@functools.lru_cache(maxsize=None)
+def _abstract_method_names(api_cls) -> Tuple[str, ...]:
+    # NOTE: ``__abstractmethods__`` is a frozenset (a previous ``dict`` check
+    # here never matched, so warnings lacked the method names).
+    if (abstract_methods := getattr(api_cls, "__abstractmethods__", None)) and isinstance(
+        abstract_methods, (set, frozenset)
+    ):
+        return tuple(abstract_methods)
+
+    return ()
+
+
+def _module_has_hookimpls(module) -> bool:
+    # Check raw ``__dict__`` entries so descriptors (e.g. ``@property`` on a
+    # class handed over as a module attribute) never execute during the scan;
+    # pluggy's own inspection getattrs every attribute of a registered module.
+    return any("ape_impl" in getattr(obj, "__dict__", ()) for obj in vars(module).values())
+
+
 class PluginManager:
-    _unimplemented_plugins: List[str] = []
+    # Fixed-offset storage; the custom ``__getattr__`` makes every attribute
+    # miss pay for a ``__dict__`` probe otherwise.
+    __slots__ = (
+        "__registered",
+        "__plugin_modules",
+        "_hookless_module_names",
+        "_unimplemented_plugins",
+        "_hookimpls_cache",
+    )
 
     def __init__(self) -> None:
         self.__registered = False
 
+        # Backing slot for ``_plugin_modules`` (``functools.cached_property``
+        # needs a ``__dict__``, which ``__slots__`` removes).
+        self.__plugin_modules: Optional[FrozenSet[str]] = None
+
+        # Modules imported without any hookimpls (e.g. ``ape_init``); they skip
+        # pluggy registration but still count as registered plugins.
+        self._hookless_module_names: Set[str] = set()
+
+        # Plugins already warned about; per-instance so managers don't share state.
+        self._unimplemented_plugins: Set[str] = set()
+
+        # Per-hook ``(plugin_name, hook_fn)`` tuples; registration only happens
+        # once, so these never change for the life of the process.
+        self._hookimpls_cache: Dict[str, Tuple[Tuple[str, Callable], ...]] = {}
+
     @log_instead_of_fail(default="<PluginManager>")
     def __repr__(self) -> str:
         return f"<{PluginManager.__name__}>"
@@ -134,22 +228,38 @@ class PluginManager:
         _assert_not_ipython_check(attr_name)
 
         # NOTE: The first time this method is called, the actual
-        #  plugin registration occurs. Registration only happens once.
-        self._register_plugins()
-
-        if not hasattr(pluggy_manager.hook, attr_name):
-            raise ApeAttributeError(f"{PluginManager.__name__} has no attribute '{attr_name}'.")
-
-        # Do this to get access to the package name
-        hook_fn = getattr(pluggy_manager.hook, attr_name)
-        hookimpls = hook_fn.get_hookimpls()
-
-        def get_plugin_name_and_hookfn(h):
-            return h.plugin_name, getattr(h.plugin, attr_name)()
-
-        for plugin_name, results in map(get_plugin_name_and_hookfn, hookimpls):
-            # NOTE: Some plugins return a tuple and some return iterators
-            if not isinstance(results, Generator):
+        #  plugin registration occurs. Registration only happens once;
+        #  afterwards this guard is a single attribute read.
+        if not self.__registered:
+            self._register_plugins()
+
+        if (hookimpls := self._hookimpls_cache.get(attr_name)) is None:
+            # Pluggy's hook relay keeps its callers in the instance dict, so one
+            # lookup replaces the hasattr/getattr descriptor walk.
+            if (hook_fn := vars(pluggy_manager.hook).get(attr_name)) is None:
+                raise ApeAttributeError(f"{PluginManager.__name__} has no attribute '{attr_name}'.")
+
+            # Do this to get access to the package name
+            hookimpls = tuple(
+                (h.plugin_name, getattr(h.plugin, attr_name)) for h in hook_fn.get_hookimpls()
+            )
+            self._hookimpls_cache[attr_name] = hookimpls
+
+        if not hookimpls:
+            # No plugin implements this hook; skip generator setup entirely.
+            return iter(())
+
+        return self._iter_hook_results(hookimpls)
+
+    def _iter_hook_results(
+        self, hookimpls: Tuple[Tuple[str, Callable], ...]
+    ) -> Iterator[Tuple[str, Tuple]]:
+        for plugin_name, plugin_hook in hookimpls:
+            results = plugin_hook()
+            # NOTE: Some plugins return a tuple and some return iterators.
+            # Identity check instead of the abc-based isinstance; generators
+            # are a concrete type and this runs per hook result.
+            if type(results) is not GeneratorType:
                 validated_plugin = self._validate_plugin(plugin_name, results)
                 if validated_plugin:
                     yield validated_plugin
@@ -163,35 +273,59 @@ class PluginManager:
     @property
     def registered_plugins(self) -> Set[str]:
         self._register_plugins()
-        return {x[0] for x in pluggy_manager.list_name_plugin()}
+        return self._hookless_module_names | {x[0] for x in pluggy_manager.list_name_plugin()}
+
+    @property
+    def _plugin_modules(self) -> FrozenSet[str]:
+        if self.__plugin_modules is not None:
+            return self.__plugin_modules
+
+        # Imported here so `import ape.plugins` stays cheap for CLI paths
+        # that never register plugins.
+        import itertools
+        import pkgutil
+        from importlib.metadata import distributions
 
-    @functools.cached_property
-    def _plugin_modules(self) -> Tuple[str, ...]:
         # NOTE: Unable to use pkgutil.iter_modules() for installed plugins
         # because it does not work with editable installs.
         # See https://github.com/python/cpython/issues/99805.
-        result = subprocess.check_output(
-            ["pip", "list", "--format", "freeze", "--disable-pip-version-check"]
+        # The distribution metadata includes editable installs and avoids
+        # shelling out to ``pip list``.
+        # NOTE: Returns frozenset because this shouldn't change.
+        self.__plugin_modules = frozenset(
+            itertools.chain(
+                (
+                    name.replace("-", "_")
+                    for dist in distributions()
+                    if (name := dist.metadata["Name"] or "").startswith("ape-")
+                ),
+                (n for _, n, ispkg in pkgutil.iter_modules() if n.startswith("ape_")),
+            )
         )
-        packages = result.decode("utf8").splitlines()
-        installed_plugin_module_names = {
-            p.split("==")[0].replace("-", "_") for p in packages if p.startswith("ape-")
-        }
-        core_plugin_module_names = {
-            n for _, n, ispkg in pkgutil.iter_modules() if n.startswith("ape_")
-        }
-
-        # NOTE: Returns tuple because this shouldn't change.
-        return tuple(installed_plugin_module_names.union(core_plugin_module_names))
+        return self.__plugin_modules
 
     def _register_plugins(self):
         if self.__registered:
             return
 
+        import importlib
+
+        # Ensure the hookspecs exist before registering implementations.
+        _get_all_plugin_hooks()
+
+        # NOTE: Imports must stay sequential. Registration runs during
+        # ``import ape`` itself, and plugin modules import ``ape`` in turn, so
+        # importing them from worker threads deadlocks on the package's
+        # import lock.
         for module_name in self._plugin_modules:
             try:
                 module = importlib.import_module(module_name)
-                pluggy_manager.register(module)
+                if _module_has_hookimpls(module):
+                    pluggy_manager.register(module)
+                else:
+                    # Skip pluggy's attribute scan but keep the module in
+                    # ``registered_plugins``.
+                    self._hookless_module_names.add(module_name)
             except Exception as err:
                 if module_name in __modules__:
                     # Always raise core plugin registration errors.
@@ -202,11 +336,14 @@ class PluginManager:
         self.__registered = True
 
     def _validate_plugin(self, plugin_name: str, plugin_cls) -> Optional[Tuple[str, Tuple]]:
+        # NOTE: Not cached; some hooks construct a fresh class per call (e.g.
+        # ``create_network_type``), so an identity-keyed cache would grow on
+        # every consumption and pin those classes forever.
         if valid_impl(plugin_cls):
             return clean_plugin_name(plugin_name), plugin_cls
-        else:
-            self._warn_not_fully_implemented_error(plugin_cls, plugin_name)
-            return None
+
+        self._warn_not_fully_implemented_error(plugin_cls, plugin_name)
+        return None
 
     def _warn_not_fully_implemented_error(self, results, plugin_name):
         if plugin_name in self._unimplemented_plugins:
@@ -222,10 +359,7 @@ class PluginManager:
                 # Likely only ever a single class in a registration, but just in case.
                 api_name = " - ".join([p.__name__ for p in classes if hasattr(p, "__name__")])
                 for api_cls in classes:
-                    if (
-                        abstract_methods := getattr(api_cls, "__abstractmethods__", None)
-                    ) and isinstance(abstract_methods, dict):
-                        unimplemented_methods.extend(api_cls.__abstractmethods__)
+                    unimplemented_methods.extend(_abstract_method_names(api_cls))
 
             else:
                 # This would only happen if the registration consisted of all primitives.
@@ -233,10 +367,7 @@ class PluginManager:
 
         elif hasattr(results, "__name__"):
             api_name = results.__name__
-            if (abstract_methods := getattr(results, "__abstractmethods__", None)) and isinstance(
-                abstract_methods, dict
-            ):
-                unimplemented_methods.extend(results.__abstractmethods__)
+            unimplemented_methods.extend(_abstract_method_names(results))
 
         else:
             api_name = results
@@ -249,7 +380,7 @@ class PluginManager:
         logger.warning(message)
 
         # Record so we don't warn repeatedly
-        self._unimplemented_plugins.append(plugin_name)
+        self._unimplemented_plugins.add(plugin_name)
 
 
 __all__ = [
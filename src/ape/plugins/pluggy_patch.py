@@ -17,3 +17,14 @@ class PluginType:
     Each one of them subclass this class. It is used to namespace the plugin hooks for the
     registration process, and to ensure overall conformance to type interfaces as much as possible.
     """
+
+    _ape_hooks: frozenset = frozenset()
+    """Names of the hook specifications defined directly on this plugin type."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Precomputed at class-definition time so hook-name lookups are O(1)
+        # instead of a __dict__ walk per call.
+        cls._ape_hooks = frozenset(
+            name for name, member in cls.__dict__.items() if hasattr(member, "ape_spec")
+        )